@@ -1,6 +1,5 @@
 import fractions
 import logging
-import math
 from itertools import tee
 from struct import pack, unpack_from
 from typing import Iterator, List, Optional, Sequence, Tuple, Type, TypeVar
@@ -152,7 +151,7 @@ class H264Encoder(Encoder):
     def _packetize_fu_a(data: bytes) -> List[bytes]:
         available_size = PACKET_MAX - FU_A_HEADER_SIZE
         payload_size = len(data) - NAL_HEADER_SIZE
-        num_packets = math.ceil(payload_size / available_size)
+        num_packets = (payload_size + available_size - 1) // available_size
         num_larger_packets = payload_size % num_packets
         package_size = payload_size // num_packets
 
@@ -12,6 +12,7 @@ from ._opus import ffi, lib
 from .base import Decoder, Encoder
 
 CHANNELS = 2
+MAX_PACKET_SIZE = 4000  # recommended max output size, see opus_encode()
 SAMPLE_RATE = 48000
 SAMPLE_WIDTH = 2
 SAMPLES_PER_FRAME = 960
@@ -53,9 +54,7 @@ class OpusEncoder(Encoder):
         )
         assert error[0] == lib.OPUS_OK
 
-        self.cdata = ffi.new(
-            "unsigned char []", SAMPLES_PER_FRAME * CHANNELS * SAMPLE_WIDTH
-        )
+        self.cdata = ffi.new("unsigned char []", MAX_PACKET_SIZE)
         self.buffer = ffi.buffer(self.cdata)
         self.rate_state: Optional[Tuple[int, Tuple[Tuple[int, int], ...]]] = None
 
@@ -70,31 +69,39 @@ class OpusEncoder(Encoder):
         assert frame.layout.name in ["mono", "stereo"]
 
         channels = len(frame.layout.channels)
-        data = bytes(frame.planes[0])
         timestamp = frame.pts
 
-        # resample at 48 kHz
-        if frame.sample_rate != SAMPLE_RATE:
-            data, self.rate_state = audioop.ratecv(
-                data,
-                SAMPLE_WIDTH,
-                channels,
-                frame.sample_rate,
-                SAMPLE_RATE,
-                self.rate_state,
-            )
-            timestamp = (timestamp * SAMPLE_RATE) // frame.sample_rate
-
-        # convert to stereo
-        if channels == 1:
-            data = audioop.tostereo(data, SAMPLE_WIDTH, 1, 1)
+        if frame.sample_rate == SAMPLE_RATE and channels == CHANNELS:
+            # Fast path: the frame is already 48 kHz stereo, so encode
+            # directly from the frame's buffer without making any copy.
+            pcm = ffi.cast("int16_t*", frame.planes[0].buffer_ptr)
+        else:
+            data = bytes(frame.planes[0])
+
+            # resample at 48 kHz
+            if frame.sample_rate != SAMPLE_RATE:
+                data, self.rate_state = audioop.ratecv(
+                    data,
+                    SAMPLE_WIDTH,
+                    channels,
+                    frame.sample_rate,
+                    SAMPLE_RATE,
+                    self.rate_state,
+                )
+                timestamp = (timestamp * SAMPLE_RATE) // frame.sample_rate
+
+            # convert to stereo
+            if channels == 1:
+                data = audioop.tostereo(data, SAMPLE_WIDTH, 1, 1)
+
+            pcm = ffi.cast("int16_t*", ffi.from_buffer(data))
 
         length = lib.opus_encode(
             self.encoder,
-            ffi.cast("int16_t*", ffi.from_buffer(data)),
+            pcm,
             SAMPLES_PER_FRAME,
             self.cdata,
-            len(self.cdata),
+            MAX_PACKET_SIZE,
         )
         assert length > 0
 
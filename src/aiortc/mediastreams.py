@@ -3,6 +3,7 @@ import fractions
 import time
 import uuid
 from abc import ABCMeta, abstractmethod
+from functools import lru_cache
 from typing import Tuple, Union
 
 from av import AudioFrame, VideoFrame
@@ -16,6 +17,17 @@ VIDEO_PTIME = 1 / 30  # 30fps
 VIDEO_TIME_BASE = fractions.Fraction(1, VIDEO_CLOCK_RATE)
 
 
+@lru_cache()
+def _blank_plane(size: int) -> bytes:
+    """
+    Return a zero-filled plane payload.
+
+    The dummy tracks emit frames with a handful of fixed plane sizes, so
+    cache the payloads instead of allocating and zeroing them per frame.
+    """
+    return bytes(size)
+
+
 def convert_timebase(
     pts: int, from_base: fractions.Fraction, to_base: fractions.Fraction
 ) -> int:
@@ -101,7 +113,7 @@ class AudioStreamTrack(MediaStreamTrack):
 
         frame = AudioFrame(format="s16", layout="mono", samples=samples)
         for p in frame.planes:
-            p.update(bytes(p.buffer_size))
+            p.update(_blank_plane(p.buffer_size))
         frame.pts = self._timestamp
         frame.sample_rate = sample_rate
         frame.time_base = fractions.Fraction(1, sample_rate)
@@ -142,7 +154,7 @@ class VideoStreamTrack(MediaStreamTrack):
 
         frame = VideoFrame(width=640, height=480)
         for p in frame.planes:
-            p.update(bytes(p.buffer_size))
+            p.update(_blank_plane(p.buffer_size))
         frame.pts = pts
         frame.time_base = time_base
         return frame
@@ -6,7 +6,7 @@ import logging
 import os
 import traceback
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Set, Type, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, TypeVar
 
 import pylibsrtp
 from cryptography import x509
@@ -48,10 +48,11 @@ class SRTPProtectionProfile:
     def get_key_and_salt(self, src, idx: int) -> bytes:
         key_start = idx * self.key_length
         salt_start = 2 * self.key_length + idx * self.salt_length
-        return (
-            src[key_start : key_start + self.key_length]
-            + src[salt_start : salt_start + self.salt_length]
-        )
+        mv = memoryview(src)
+        out = bytearray(self.key_length + self.salt_length)
+        out[: self.key_length] = mv[key_start : key_start + self.key_length]
+        out[self.key_length :] = mv[salt_start : salt_start + self.salt_length]
+        return bytes(out)
 
 
 SRTP_AEAD_AES_256_GCM = SRTPProtectionProfile(
@@ -88,6 +89,16 @@ for srtp_profile in [
         SRTP_PROFILES.append(srtp_profile)
 
 
+# Classify inbound datagrams by their first byte, as specified by RFC 7983:
+# 0 = discard, 1 = DTLS, 2 = RTP / RTCP.
+DATAGRAM_CLASS = bytes(
+    1 if (b > 19 and b < 64) else 2 if (b > 127 and b < 192) else 0
+    for b in range(256)
+)
+DATAGRAM_DTLS = 1
+DATAGRAM_RTP = 2
+
+
 def certificate_digest(x509: crypto.X509) -> str:
     return x509.digest("SHA256").decode("ascii")
 
@@ -148,6 +159,8 @@ class RTCCertificate:
     def __init__(self, key: crypto.PKey, cert: crypto.X509) -> None:
         self._key = key
         self._cert = cert
+        self._fingerprint: Optional[str] = None
+        self._ssl_contexts: Dict[Tuple[bytes, ...], SSL.Context] = {}
 
     @property
     def expires(self) -> datetime.datetime:
@@ -161,10 +174,12 @@ class RTCCertificate:
         Returns the list of certificate fingerprints, one of which is computed
         with the digest algorithm used in the certificate signature.
         """
+        if self._fingerprint is None:
+            self._fingerprint = certificate_digest(self._cert)
         return [
             RTCDtlsFingerprint(
                 algorithm="sha-256",
-                value=certificate_digest(self._cert),
+                value=self._fingerprint,
             )
         ]
 
@@ -185,6 +200,13 @@ class RTCCertificate:
     def _create_ssl_context(
         self, srtp_profiles: List[SRTPProtectionProfile]
     ) -> SSL.Context:
+        # An SSL.Context can be shared by any number of connections, so
+        # build it once per set of SRTP profiles instead of per session.
+        cache_key = tuple(x.openssl_profile for x in srtp_profiles)
+        ctx = self._ssl_contexts.get(cache_key)
+        if ctx is not None:
+            return ctx
+
         ctx = SSL.Context(SSL.DTLS_METHOD)
         ctx.set_verify(
             SSL.VERIFY_PEER | SSL.VERIFY_FAIL_IF_NO_PEER_CERT, lambda *args: 1
@@ -196,6 +218,7 @@ class RTCCertificate:
         )
         ctx.set_tlsext_use_srtp(b":".join(x.openssl_profile for x in srtp_profiles))
 
+        self._ssl_contexts[cache_key] = ctx
         return ctx
 
 
@@ -348,6 +371,12 @@ class RTCDtlsTransport(AsyncIOEventEmitter):
         self._rx_srtp: Session = None
         self._tx_srtp: Session = None
 
+        # hot-path SRTP methods, bound once the handshake completes
+        self._rx_unprotect: Optional[Callable[[bytes], bytes]] = None
+        self._rx_unprotect_rtcp: Optional[Callable[[bytes], bytes]] = None
+        self._tx_protect: Optional[Callable[[bytes], bytes]] = None
+        self._tx_protect_rtcp: Optional[Callable[[bytes], bytes]] = None
+
         # SSL
         self._srtp_profiles = SRTP_PROFILES
         self._ssl: Optional[SSL.Connection] = None
@@ -487,6 +516,12 @@ class RTCDtlsTransport(AsyncIOEventEmitter):
         tx_policy.window_size = 1024
         self._tx_srtp = Session(tx_policy)
 
+        # bind per-packet SRTP methods to avoid repeated attribute lookups
+        self._rx_unprotect = self._rx_srtp.unprotect
+        self._rx_unprotect_rtcp = self._rx_srtp.unprotect_rtcp
+        self._tx_protect = self._tx_srtp.protect
+        self._tx_protect_rtcp = self._tx_srtp.protect_rtcp
+
         # start data pump
         self.__log_debug("- DTLS handshake complete")
         self._set_state(State.CONNECTED)
@@ -589,31 +624,41 @@ class RTCDtlsTransport(AsyncIOEventEmitter):
         self.__rx_bytes += len(data)
         self.__rx_packets += 1
 
-        first_byte = data[0]
-        if first_byte > 19 and first_byte < 64:
+        datagram_class = DATAGRAM_CLASS[data[0]]
+        if datagram_class == DATAGRAM_DTLS:
             # DTLS
             self._ssl.bio_write(data)
-            try:
-                data = self._ssl.recv(1500)
-            except SSL.ZeroReturnError:
-                data = None
-            except SSL.Error:
-                data = b""
+
+            # Read out every decrypted record OpenSSL has buffered, not just
+            # the first one, so records coalesced into a single datagram or
+            # buffered during a burst do not wait for the next recv wakeup.
+            received = []
+            shutdown = False
+            while True:
+                try:
+                    received.append(self._ssl.recv(1500))
+                except SSL.ZeroReturnError:
+                    shutdown = True
+                    break
+                except SSL.Error:
+                    break
             await self._write_ssl()
-            if data is None:
+            if self._data_receiver:
+                for message in received:
+                    if message:
+                        await self._data_receiver._handle_data(message)
+            if shutdown:
                 self.__log_debug("- DTLS shutdown by remote party")
                 raise ConnectionError
-            elif data and self._data_receiver:
-                await self._data_receiver._handle_data(data)
-        elif first_byte > 127 and first_byte < 192 and self._rx_srtp:
+        elif datagram_class == DATAGRAM_RTP and self._rx_srtp:
             # SRTP / SRTCP
             arrival_time_ms = clock.current_ms()
             try:
                 if is_rtcp(data):
-                    data = self._rx_srtp.unprotect_rtcp(data)
+                    data = self._rx_unprotect_rtcp(data)
                     await self._handle_rtcp_data(data)
                 else:
-                    data = self._rx_srtp.unprotect(data)
+                    data = self._rx_unprotect(data)
                     await self._handle_rtp_data(data, arrival_time_ms=arrival_time_ms)
             except pylibsrtp.Error as exc:
                 self.__log_debug("x SRTP unprotect failed: %s", exc)
@@ -653,9 +698,9 @@ class RTCDtlsTransport(AsyncIOEventEmitter):
             raise ConnectionError("Cannot send encrypted RTP, not connected")
 
         if is_rtcp(data):
-            data = self._tx_srtp.protect_rtcp(data)
+            data = self._tx_protect_rtcp(data)
         else:
-            data = self._tx_srtp.protect(data)
+            data = self._tx_protect(data)
         await self.transport._send(data)
         self.__tx_bytes += len(data)
         self.__tx_packets += 1
@@ -683,11 +728,13 @@ class RTCDtlsTransport(AsyncIOEventEmitter):
         """
         Flush outgoing data which OpenSSL put in our BIO to the transport.
         """
-        try:
-            data = self._ssl.bio_read(1500)
-        except SSL.Error:
-            data = b""
-        if data:
+        while True:
+            try:
+                data = self._ssl.bio_read(1500)
+            except SSL.Error:
+                data = b""
+            if not data:
+                break
             await self.transport._send(data)
             self.__tx_bytes += len(data)
             self.__tx_packets += 1
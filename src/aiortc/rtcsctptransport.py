@@ -1,13 +1,14 @@
 import asyncio
 import enum
+import hashlib
 import hmac
 import logging
-import math
 import os
 import time
 from collections import deque
 from dataclasses import dataclass, field
-from struct import pack, unpack_from
+from itertools import chain
+from struct import Struct, pack, unpack_from
 from typing import (
     Any,
     Callable,
@@ -22,6 +23,7 @@ from typing import (
     no_type_check,
 )
 
+from google_crc32c import extend as crc32c_extend
 from google_crc32c import value as crc32c
 from pyee.asyncio import AsyncIOEventEmitter
 
@@ -38,6 +40,10 @@ COOKIE_LIFETIME = 60
 MAX_STREAMS = 65535
 USERDATA_MAX_LENGTH = 1200
 
+# maximum size of the chunks bundled into a single packet, sized so that
+# a packet never carries more than one full-size DATA chunk
+BUNDLE_MAX_LENGTH = USERDATA_MAX_LENGTH + 16
+
 # protocol constants
 SCTP_CAUSE_INVALID_STREAM = 0x0001
 SCTP_CAUSE_STALE_COOKIE = 0x0003
@@ -65,6 +71,10 @@ SCTP_STR_RESET_RESPONSE = 0x0010
 SCTP_STR_RESET_ADD_OUT_STREAMS = 0x0011
 SCTP_SUPPORTED_CHUNK_EXT = 0x8008
 SCTP_PRSCTP_SUPPORTED = 0xC000
+SCTP_ZERO_CHECKSUM = 0x8001
+
+# RFC 9653 error detection method identifier for SCTP over DTLS
+SCTP_EDMID_LOWER_LAYER_DTLS = 1
 
 # data channel constants
 DATA_CHANNEL_ACK = 2
@@ -83,6 +93,17 @@ WEBRTC_BINARY = 53
 WEBRTC_STRING_EMPTY = 56
 WEBRTC_BINARY_EMPTY = 57
 
+# precompiled structs for the hot parse / serialize paths
+SCTP_HEADER = Struct("!HHL")
+SCTP_CHECKSUM = Struct("<L")
+CHUNK_HEADER = Struct("!BBH")
+CHUNK_PARAM_HEADER = Struct("!HH")
+DATA_CHUNK_HEADER = Struct("!BBHLHHL")
+DATA_CHUNK_FIELDS = Struct("!LHHL")
+INIT_CHUNK_FIELDS = Struct("!LLHHL")
+SACK_CHUNK_HEADER = Struct("!BBHLLHH")
+SACK_CHUNK_FIELDS = Struct("!LLHH")
+
 
 def chunk_type(chunk) -> str:
     return chunk.__class__.__name__
@@ -92,26 +113,26 @@ def decode_params(body: bytes) -> List[Tuple[int, bytes]]:
     params = []
     pos = 0
     while pos <= len(body) - 4:
-        param_type, param_length = unpack_from("!HH", body, pos)
-        params.append((param_type, body[pos + 4 : pos + param_length]))
+        param_type, param_length = CHUNK_PARAM_HEADER.unpack_from(body, pos)
+        params.append((param_type, bytes(body[pos + 4 : pos + param_length])))
         pos += param_length + padl(param_length)
     return params
 
 
 def encode_params(params: List[Tuple[int, bytes]]) -> bytes:
-    body = b""
+    body = bytearray()
     padding = b""
     for param_type, param_value in params:
         param_length = len(param_value) + 4
         body += padding
-        body += pack("!HH", param_type, param_length) + param_value
-        padding = b"\x00" * padl(param_length)
-    return body
+        body += CHUNK_PARAM_HEADER.pack(param_type, param_length)
+        body += param_value
+        padding = bytes(padl(param_length))
+    return bytes(body)
 
 
 def padl(length: int) -> int:
-    m = length % 4
-    return 4 - m if m else 0
+    return -length & 3
 
 
 def tsn_minus_one(a: int) -> int:
@@ -127,12 +148,12 @@ class Chunk:
 
     def __init__(self, flags: int = 0, body: bytes = b"") -> None:
         self.flags = flags
-        self.body = body
+        self.body = bytes(body) if body else b""
 
     def __bytes__(self) -> bytes:
         body = self.body
-        data = pack("!BBH", self.type, self.flags, len(body) + 4) + body
-        data += b"\x00" * padl(len(body))
+        data = CHUNK_HEADER.pack(self.type, self.flags, len(body) + 4) + body
+        data += bytes(padl(len(body)))
         return data
 
     def __repr__(self) -> str:
@@ -169,11 +190,12 @@ class DataChunk(Chunk):
 
     def __init__(self, flags: int = 0, body: Optional[bytes] = None) -> None:
         self.flags = flags
+        self._wire: Optional[bytes] = None
         if body:
-            (self.tsn, self.stream_id, self.stream_seq, self.protocol) = unpack_from(
-                "!LHHL", body
+            (self.tsn, self.stream_id, self.stream_seq, self.protocol) = (
+                DATA_CHUNK_FIELDS.unpack_from(body)
             )
-            self.user_data = body[12:]
+            self.user_data = bytes(body[12:])
         else:
             self.tsn = 0
             self.stream_id = 0
@@ -182,23 +204,31 @@ class DataChunk(Chunk):
             self.user_data = b""
 
     def __bytes__(self) -> bytes:
-        length = 16 + len(self.user_data)
-        data = (
-            pack(
-                "!BBHLHHL",
-                self.type,
-                self.flags,
-                length,
-                self.tsn,
-                self.stream_id,
-                self.stream_seq,
-                self.protocol,
+        # The wire form is cached: a DATA chunk's fields no longer change
+        # once it has been queued, but the chunk may be serialized again
+        # when it is retransmitted.
+        if self._wire is None:
+            # user_data may be a memoryview, which join() accepts without
+            # a copy
+            length = 16 + len(self.user_data)
+            data = b"".join(
+                [
+                    DATA_CHUNK_HEADER.pack(
+                        self.type,
+                        self.flags,
+                        length,
+                        self.tsn,
+                        self.stream_id,
+                        self.stream_seq,
+                        self.protocol,
+                    ),
+                    self.user_data,
+                ]
             )
-            + self.user_data
-        )
-        if length % 4:
-            data += b"\x00" * padl(length)
-        return data
+            if length % 4:
+                data += bytes(padl(length))
+            self._wire = data
+        return self._wire
 
     def __repr__(self) -> str:
         return (
@@ -260,7 +290,7 @@ class BaseInitChunk(Chunk):
                 self.outbound_streams,
                 self.inbound_streams,
                 self.initial_tsn,
-            ) = unpack_from("!LLHHL", body)
+            ) = INIT_CHUNK_FIELDS.unpack_from(body)
             self.params = decode_params(body[16:])
         else:
             self.initiate_tag = 0
@@ -272,8 +302,7 @@ class BaseInitChunk(Chunk):
 
     @property
     def body(self) -> bytes:  # type: ignore
-        body = pack(
-            "!LLHHL",
+        body = INIT_CHUNK_FIELDS.pack(
             self.initiate_tag,
             self.advertised_rwnd,
             self.outbound_streams,
@@ -309,22 +338,21 @@ class SackChunk(Chunk):
                 self.advertised_rwnd,
                 nb_gaps,
                 nb_duplicates,
-            ) = unpack_from("!LLHH", body)
-            pos = 12
-            for i in range(nb_gaps):
-                self.gaps.append(unpack_from("!HH", body, pos))
-                pos += 4
-            for i in range(nb_duplicates):
-                self.duplicates.append(unpack_from("!L", body, pos)[0])
-                pos += 4
+            ) = SACK_CHUNK_FIELDS.unpack_from(body)
+            if nb_gaps:
+                flat = unpack_from("!%dH" % (2 * nb_gaps), body, 12)
+                self.gaps = list(zip(flat[::2], flat[1::2]))
+            if nb_duplicates:
+                self.duplicates = list(
+                    unpack_from("!%dL" % nb_duplicates, body, 12 + 4 * nb_gaps)
+                )
         else:
             self.cumulative_tsn = 0
             self.advertised_rwnd = 0
 
     def __bytes__(self) -> bytes:
         length = 16 + 4 * (len(self.gaps) + len(self.duplicates))
-        data = pack(
-            "!BBHLLHH",
+        data = SACK_CHUNK_HEADER.pack(
             self.type,
             self.flags,
             length,
@@ -333,10 +361,10 @@ class SackChunk(Chunk):
             len(self.gaps),
             len(self.duplicates),
         )
-        for gap in self.gaps:
-            data += pack("!HH", *gap)
-        for tsn in self.duplicates:
-            data += pack("!L", tsn)
+        if self.gaps:
+            data += pack("!%dH" % (2 * len(self.gaps)), *chain.from_iterable(self.gaps))
+        if self.duplicates:
+            data += pack("!%dL" % len(self.duplicates), *self.duplicates)
         return data
 
     def __repr__(self) -> str:
@@ -391,27 +419,47 @@ CHUNK_CLASSES = [
     ReconfigChunk,
     ForwardTsnChunk,
 ]
-CHUNK_TYPES = dict((cls.type, cls) for cls in CHUNK_CLASSES)
+# flat lookup table indexed by the chunk type byte
+CHUNK_BY_TYPE: List[Optional[type]] = [None] * 256
+for _cls in CHUNK_CLASSES:
+    CHUNK_BY_TYPE[_cls.type] = _cls
 
 
-def parse_packet(data: bytes) -> Tuple[int, int, int, List[Any]]:
+def parse_packet(
+    data: bytes, zero_checksum: bool = False
+) -> Tuple[int, int, int, List[Any]]:
     length = len(data)
     if length < 12:
         raise ValueError("SCTP packet length is less than 12 bytes")
 
-    source_port, destination_port, verification_tag = unpack_from("!HHL", data)
-
-    # verify checksum
-    checksum = unpack_from("<L", data, 8)[0]
-    if checksum != crc32c(data[0:8] + b"\x00\x00\x00\x00" + data[12:]):
-        raise ValueError("SCTP packet has invalid checksum")
-
+    source_port, destination_port, verification_tag = SCTP_HEADER.unpack_from(data)
+
+    # verify checksum, computed with the checksum field zeroed, without
+    # materialising a zeroed copy of the whole packet; the crc32c functions
+    # only accept read-only bytes, so feed them plain slices
+    #
+    # a zero checksum is accepted as-is if the peer was offered the
+    # RFC 9653 zero checksum extension, except on packets carrying an
+    # INIT chunk, which must always have a correct checksum
+    checksum = SCTP_CHECKSUM.unpack_from(data, 8)[0]
+    mv = memoryview(data)
+    if not (
+        zero_checksum
+        and checksum == 0
+        and (length == 12 or data[12] != InitChunk.type)
+    ):
+        crc = crc32c_extend(crc32c(data[:8]), b"\x00\x00\x00\x00")
+        if checksum != crc32c_extend(crc, data[12:]):
+            raise ValueError("SCTP packet has invalid checksum")
+
+    # pass memoryview slices to the chunk constructors, so that only the
+    # data which outlives parsing gets copied
     chunks = []
     pos = 12
     while pos <= length - 4:
-        chunk_type, chunk_flags, chunk_length = unpack_from("!BBH", data, pos)
-        chunk_body = data[pos + 4 : pos + chunk_length]
-        chunk_cls = CHUNK_TYPES.get(chunk_type)
+        chunk_type, chunk_flags, chunk_length = CHUNK_HEADER.unpack_from(data, pos)
+        chunk_body = mv[pos + 4 : pos + chunk_length]
+        chunk_cls = CHUNK_BY_TYPE[chunk_type]
         if chunk_cls:
             chunks.append(chunk_cls(flags=chunk_flags, body=chunk_body))
         pos += chunk_length + padl(chunk_length)
@@ -419,12 +467,22 @@ def parse_packet(data: bytes) -> Tuple[int, int, int, List[Any]]:
 
 
 def serialize_packet(
-    source_port: int, destination_port: int, verification_tag: int, chunk: Chunk
+    source_port: int,
+    destination_port: int,
+    verification_tag: int,
+    chunk: Chunk,
+    zero_checksum: bool = False,
 ) -> bytes:
-    header = pack("!HHL", source_port, destination_port, verification_tag)
-    data = bytes(chunk)
-    checksum = crc32c(header + b"\x00\x00\x00\x00" + data)
-    return header + pack("<L", checksum) + data
+    # Serialize into a single buffer: the checksum is computed with its field
+    # zeroed, which is how the bytearray starts out, then patched in place;
+    # crc32c only accepts read-only bytes, hence the frozen copy.
+    # With the RFC 9653 extension negotiated the field is simply left zeroed.
+    data = bytearray(12)
+    SCTP_HEADER.pack_into(data, 0, source_port, destination_port, verification_tag)
+    data += bytes(chunk)
+    if not zero_checksum:
+        SCTP_CHECKSUM.pack_into(data, 8, crc32c(bytes(data)))
+    return bytes(data)
 
 
 # RFC 6525
@@ -501,18 +559,33 @@ class InboundStream:
         self.sequence_number = 0
 
     def add_chunk(self, chunk: DataChunk) -> None:
-        if not self.reassembly or uint32_gt(chunk.tsn, self.reassembly[-1].tsn):
-            self.reassembly.append(chunk)
+        reassembly = self.reassembly
+        if not reassembly or uint32_gt(chunk.tsn, reassembly[-1].tsn):
+            reassembly.append(chunk)
+            return
+
+        # binary search over TSNs rebased against the first chunk, so that
+        # comparisons stay valid across the 32-bit wraparound
+        base = reassembly[0].tsn
+        if uint32_gt(base, chunk.tsn):
+            reassembly.insert(0, chunk)
             return
 
-        for i, rchunk in enumerate(self.reassembly):
-            # should never happen, the chunk should have been eliminated
-            # as a duplicate when _mark_received() is called
-            assert rchunk.tsn != chunk.tsn, "duplicate chunk in reassembly"
+        key = (chunk.tsn - base) % SCTP_TSN_MODULO
+        lo = 0
+        hi = len(reassembly)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if (reassembly[mid].tsn - base) % SCTP_TSN_MODULO < key:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        # should never happen, the chunk should have been eliminated
+        # as a duplicate when _mark_received() is called
+        assert reassembly[lo].tsn != chunk.tsn, "duplicate chunk in reassembly"
 
-            if uint32_gt(rchunk.tsn, chunk.tsn):
-                self.reassembly.insert(i, chunk)
-                break
+        reassembly.insert(lo, chunk)
 
     def pop_messages(self) -> Iterator[Tuple[int, int, bytes]]:
         pos = 0
@@ -543,9 +616,7 @@ class InboundStream:
                 user_data = b"".join(
                     [c.user_data for c in self.reassembly[start_pos : pos + 1]]
                 )
-                self.reassembly = (
-                    self.reassembly[:start_pos] + self.reassembly[pos + 1 :]
-                )
+                del self.reassembly[start_pos : pos + 1]
                 if ordered and chunk.stream_seq == self.sequence_number:
                     self.sequence_number = uint16_add(self.sequence_number, 1)
                 pos = start_pos
@@ -568,7 +639,7 @@ class InboundStream:
             else:
                 break
 
-        self.reassembly = self.reassembly[pos + 1 :]
+        del self.reassembly[: pos + 1]
         return size
 
 
@@ -611,12 +682,16 @@ class RTCSctpTransport(AsyncIOEventEmitter):
 
         self._local_partial_reliability = True
         self._local_port = port
+        # as SCTP always runs over DTLS here, which provides its own
+        # integrity check, accept zero checksums (RFC 9653)
+        self._local_zero_checksum = True
         self._local_verification_tag = random32()
 
         self._remote_extensions: List[int] = []
         self._remote_partial_reliability = False
         self._remote_port: Optional[int] = None
         self._remote_verification_tag = 0
+        self._remote_zero_checksum = False
 
         # inbound
         self._advertised_rwnd = 1024 * 1024
@@ -629,6 +704,9 @@ class RTCSctpTransport(AsyncIOEventEmitter):
         self._sack_needed = False
 
         # outbound
+        self._bundling = 0
+        self._pending_chunks: List[bytes] = []
+        self._pending_length = 0
         self._cwnd = 3 * USERDATA_MAX_LENGTH
         self._fast_recovery_exit = None
         self._fast_recovery_transmit = False
@@ -663,6 +741,23 @@ class RTCSctpTransport(AsyncIOEventEmitter):
         self._t2_handle: Optional[asyncio.TimerHandle] = None
         self._t3_handle: Optional[asyncio.TimerHandle] = None
 
+        # per-class chunk dispatch
+        self._chunk_handlers = {
+            AbortChunk: self._receive_abort_chunk,
+            CookieAckChunk: self._receive_cookie_ack_chunk,
+            CookieEchoChunk: self._receive_cookie_echo_chunk,
+            DataChunk: self._receive_data_chunk,
+            ErrorChunk: self._receive_error_chunk,
+            ForwardTsnChunk: self._receive_forward_tsn_chunk,
+            HeartbeatChunk: self._receive_heartbeat_chunk,
+            InitChunk: self._receive_init_chunk,
+            InitAckChunk: self._receive_init_ack_chunk,
+            ReconfigChunk: self._receive_reconfig_chunk,
+            SackChunk: self._receive_sack_chunk,
+            ShutdownChunk: self._receive_shutdown_chunk,
+            ShutdownCompleteChunk: self._receive_shutdown_complete_chunk,
+        }
+
         # data channels
         self._data_channel_id: Optional[int] = None
         self._data_channel_queue: Deque[Tuple[RTCDataChannel, int, bytes]] = deque()
@@ -796,6 +891,9 @@ class RTCSctpTransport(AsyncIOEventEmitter):
                 self._remote_partial_reliability = True
             elif k == SCTP_SUPPORTED_CHUNK_EXT:
                 self._remote_extensions = list(v)
+            elif k == SCTP_ZERO_CHECKSUM:
+                if v == pack("!L", SCTP_EDMID_LOWER_LAYER_DTLS):
+                    self._remote_zero_checksum = True
 
     def _set_extensions(self, params: List[Tuple[int, bytes]]) -> None:
         """
@@ -809,6 +907,9 @@ class RTCSctpTransport(AsyncIOEventEmitter):
         extensions.append(ReconfigChunk.type)
         params.append((SCTP_SUPPORTED_CHUNK_EXT, bytes(extensions)))
 
+        if self._local_zero_checksum:
+            params.append((SCTP_ZERO_CHECKSUM, pack("!L", SCTP_EDMID_LOWER_LAYER_DTLS)))
+
     def _get_inbound_stream(self, stream_id: int) -> InboundStream:
         """
         Get or create the inbound stream with the specified ID.
@@ -817,6 +918,17 @@ class RTCSctpTransport(AsyncIOEventEmitter):
             self._inbound_streams[stream_id] = InboundStream()
         return self._inbound_streams[stream_id]
 
+    def _get_cookie_mac(self, data: bytes) -> bytes:
+        """
+        Compute the MAC protecting a state cookie.
+
+        Keyed BLAKE2b replaces HMAC-SHA1 here: cookies are only ever
+        verified by the endpoint which issued them, so the MAC format is
+        purely internal, and BLAKE2b is both faster and needs no HMAC
+        construction.
+        """
+        return hashlib.blake2b(data, key=self._hmac_key, digest_size=20).digest()
+
     def _get_timestamp(self) -> int:
         return int(time.time())
 
@@ -825,13 +937,14 @@ class RTCSctpTransport(AsyncIOEventEmitter):
         Handle data received from the network.
         """
         try:
-            _, _, verification_tag, chunks = parse_packet(data)
+            _, _, verification_tag, chunks = parse_packet(
+                data, zero_checksum=self._local_zero_checksum
+            )
         except ValueError:
             return
 
         # is this an init?
-        init_chunk = len([x for x in chunks if isinstance(x, InitChunk)])
-        if init_chunk:
+        if any(isinstance(x, InitChunk) for x in chunks):
             assert len(chunks) == 1
             expected_tag = 0
         else:
@@ -919,154 +1032,60 @@ class RTCSctpTransport(AsyncIOEventEmitter):
 
     async def _receive_chunk(self, chunk):
         """
-        Handle an incoming chunk.
+        Handle an incoming chunk, dispatching on its class.
         """
         self.__log_debug("< %s", chunk)
+        handler = self._chunk_handlers.get(chunk.__class__)
+        if handler is not None:
+            await handler(chunk)
 
-        # common
-        if isinstance(chunk, DataChunk):
-            await self._receive_data_chunk(chunk)
-        elif isinstance(chunk, SackChunk):
-            await self._receive_sack_chunk(chunk)
-        elif isinstance(chunk, ForwardTsnChunk):
-            await self._receive_forward_tsn_chunk(chunk)
-        elif isinstance(chunk, HeartbeatChunk):
-            ack = HeartbeatAckChunk()
-            ack.params = chunk.params
-            await self._send_chunk(ack)
-        elif isinstance(chunk, AbortChunk):
-            self.__log_debug("x Association was aborted by remote party")
-            self._set_state(self.State.CLOSED)
-        elif isinstance(chunk, ShutdownChunk):
-            self._t2_cancel()
-            self._set_state(self.State.SHUTDOWN_RECEIVED)
-            ack = ShutdownAckChunk()
-            await self._send_chunk(ack)
-            self._t2_start(ack)
-            self._set_state(self.State.SHUTDOWN_ACK_SENT)
-        elif (
-            isinstance(chunk, ShutdownCompleteChunk)
-            and self._association_state == self.State.SHUTDOWN_ACK_SENT
-        ):
-            self._t2_cancel()
-            self._set_state(self.State.CLOSED)
-        elif (
-            isinstance(chunk, ReconfigChunk)
-            and self._association_state == self.State.ESTABLISHED
-        ):
-            for param in chunk.params:
-                cls = RECONFIG_PARAM_TYPES.get(param[0])
-                if cls:
-                    await self._receive_reconfig_param(cls.parse(param[1]))
-
-        # server
-        elif isinstance(chunk, InitChunk) and self.is_server:
-            self._last_received_tsn = tsn_minus_one(chunk.initial_tsn)
-            self._reconfig_response_seq = tsn_minus_one(chunk.initial_tsn)
-            self._remote_verification_tag = chunk.initiate_tag
-            self._ssthresh = chunk.advertised_rwnd
-            self._get_extensions(chunk.params)
+    async def _receive_abort_chunk(self, chunk: AbortChunk) -> None:
+        """
+        Handle an ABORT chunk.
+        """
+        self.__log_debug("x Association was aborted by remote party")
+        self._set_state(self.State.CLOSED)
 
-            self.__log_debug(
-                "- Peer supports %d outbound streams, %d max inbound streams",
-                chunk.outbound_streams,
-                chunk.inbound_streams,
-            )
-            self._inbound_streams_count = min(
-                chunk.outbound_streams, self._inbound_streams_max
-            )
-            self._outbound_streams_count = min(
-                self._outbound_streams_count, chunk.inbound_streams
-            )
+    async def _receive_cookie_ack_chunk(self, chunk: CookieAckChunk) -> None:
+        """
+        Handle a COOKIE ACK chunk (client only).
+        """
+        if self._association_state != self.State.COOKIE_ECHOED:
+            return
 
-            ack = InitAckChunk()
-            ack.initiate_tag = self._local_verification_tag
-            ack.advertised_rwnd = self._advertised_rwnd
-            ack.outbound_streams = self._outbound_streams_count
-            ack.inbound_streams = self._inbound_streams_max
-            ack.initial_tsn = self._local_tsn
-            self._set_extensions(ack.params)
-
-            # generate state cookie
-            cookie = pack("!L", self._get_timestamp())
-            cookie += hmac.new(self._hmac_key, cookie, "sha1").digest()
-            ack.params.append((SCTP_STATE_COOKIE, cookie))
-            await self._send_chunk(ack)
-        elif isinstance(chunk, CookieEchoChunk) and self.is_server:
-            # check state cookie MAC
-            cookie = chunk.body
-            if (
-                len(cookie) != COOKIE_LENGTH
-                or hmac.new(self._hmac_key, cookie[0:4], "sha1").digest() != cookie[4:]
-            ):
-                self.__log_debug("x State cookie is invalid")
-                return
-
-            # check state cookie lifetime
-            now = self._get_timestamp()
-            stamp = unpack_from("!L", cookie)[0]
-            if stamp < now - COOKIE_LIFETIME or stamp > now:
-                self.__log_debug("x State cookie has expired")
-                error = ErrorChunk()
-                error.params.append((SCTP_CAUSE_STALE_COOKIE, b"\x00" * 8))
-                await self._send_chunk(error)
-                return
-
-            ack = CookieAckChunk()
-            await self._send_chunk(ack)
-            self._set_state(self.State.ESTABLISHED)
-
-        # client
-        elif (
-            isinstance(chunk, InitAckChunk)
-            and self._association_state == self.State.COOKIE_WAIT
-        ):
-            # cancel T1 timer and process chunk
-            self._t1_cancel()
-            self._last_received_tsn = tsn_minus_one(chunk.initial_tsn)
-            self._reconfig_response_seq = tsn_minus_one(chunk.initial_tsn)
-            self._remote_verification_tag = chunk.initiate_tag
-            self._ssthresh = chunk.advertised_rwnd
-            self._get_extensions(chunk.params)
+        # cancel T1 timer and enter ESTABLISHED state
+        self._t1_cancel()
+        self._set_state(self.State.ESTABLISHED)
 
-            self.__log_debug(
-                "- Peer supports %d outbound streams, %d max inbound streams",
-                chunk.outbound_streams,
-                chunk.inbound_streams,
-            )
-            self._inbound_streams_count = min(
-                chunk.outbound_streams, self._inbound_streams_max
-            )
-            self._outbound_streams_count = min(
-                self._outbound_streams_count, chunk.inbound_streams
-            )
+    async def _receive_cookie_echo_chunk(self, chunk: CookieEchoChunk) -> None:
+        """
+        Handle a COOKIE ECHO chunk (server only).
+        """
+        if not self.is_server:
+            return
 
-            echo = CookieEchoChunk()
-            for k, v in chunk.params:
-                if k == SCTP_STATE_COOKIE:
-                    echo.body = v
-                    break
-            await self._send_chunk(echo)
-
-            # start T1 timer and enter COOKIE-ECHOED state
-            self._t1_start(echo)
-            self._set_state(self.State.COOKIE_ECHOED)
-        elif (
-            isinstance(chunk, CookieAckChunk)
-            and self._association_state == self.State.COOKIE_ECHOED
+        # check state cookie MAC
+        cookie = chunk.body
+        if len(cookie) != COOKIE_LENGTH or not hmac.compare_digest(
+            self._get_cookie_mac(cookie[0:4]), cookie[4:]
         ):
-            # cancel T1 timer and enter ESTABLISHED state
-            self._t1_cancel()
-            self._set_state(self.State.ESTABLISHED)
-        elif isinstance(chunk, ErrorChunk) and self._association_state in [
-            self.State.COOKIE_WAIT,
-            self.State.COOKIE_ECHOED,
-        ]:
-            self._t1_cancel()
-            self._set_state(self.State.CLOSED)
-            self.__log_debug("x Could not establish association")
+            self.__log_debug("x State cookie is invalid")
+            return
+
+        # check state cookie lifetime
+        now = self._get_timestamp()
+        stamp = unpack_from("!L", cookie)[0]
+        if stamp < now - COOKIE_LIFETIME or stamp > now:
+            self.__log_debug("x State cookie has expired")
+            error = ErrorChunk()
+            error.params.append((SCTP_CAUSE_STALE_COOKIE, bytes(8)))
+            await self._send_chunk(error)
             return
 
+        ack = CookieAckChunk()
+        await self._send_chunk(ack)
+        self._set_state(self.State.ESTABLISHED)
+
     async def _receive_data_chunk(self, chunk: DataChunk) -> None:
         """
         Handle a DATA chunk.
@@ -1087,6 +1106,18 @@ class RTCSctpTransport(AsyncIOEventEmitter):
             self._advertised_rwnd += len(message[2])
             await self._receive(*message)
 
+    async def _receive_error_chunk(self, chunk: ErrorChunk) -> None:
+        """
+        Handle an ERROR chunk (client only).
+        """
+        if self._association_state in [
+            self.State.COOKIE_WAIT,
+            self.State.COOKIE_ECHOED,
+        ]:
+            self._t1_cancel()
+            self._set_state(self.State.CLOSED)
+            self.__log_debug("x Could not establish association")
+
     async def _receive_forward_tsn_chunk(self, chunk: ForwardTsnChunk) -> None:
         """
         Handle a FORWARD TSN chunk.
@@ -1129,6 +1160,104 @@ class RTCSctpTransport(AsyncIOEventEmitter):
                 self._last_received_tsn
             )
 
+    async def _receive_heartbeat_chunk(self, chunk: HeartbeatChunk) -> None:
+        """
+        Handle a HEARTBEAT chunk.
+        """
+        ack = HeartbeatAckChunk()
+        ack.params = chunk.params
+        await self._send_chunk(ack)
+
+    async def _receive_init_chunk(self, chunk: InitChunk) -> None:
+        """
+        Handle an INIT chunk (server only).
+        """
+        if not self.is_server:
+            return
+
+        self._last_received_tsn = tsn_minus_one(chunk.initial_tsn)
+        self._reconfig_response_seq = tsn_minus_one(chunk.initial_tsn)
+        self._remote_verification_tag = chunk.initiate_tag
+        self._ssthresh = chunk.advertised_rwnd
+        self._get_extensions(chunk.params)
+
+        self.__log_debug(
+            "- Peer supports %d outbound streams, %d max inbound streams",
+            chunk.outbound_streams,
+            chunk.inbound_streams,
+        )
+        self._inbound_streams_count = min(
+            chunk.outbound_streams, self._inbound_streams_max
+        )
+        self._outbound_streams_count = min(
+            self._outbound_streams_count, chunk.inbound_streams
+        )
+
+        ack = InitAckChunk()
+        ack.initiate_tag = self._local_verification_tag
+        ack.advertised_rwnd = self._advertised_rwnd
+        ack.outbound_streams = self._outbound_streams_count
+        ack.inbound_streams = self._inbound_streams_max
+        ack.initial_tsn = self._local_tsn
+        self._set_extensions(ack.params)
+
+        # generate state cookie
+        cookie = pack("!L", self._get_timestamp())
+        cookie += self._get_cookie_mac(cookie)
+        ack.params.append((SCTP_STATE_COOKIE, cookie))
+        await self._send_chunk(ack)
+
+    async def _receive_init_ack_chunk(self, chunk: InitAckChunk) -> None:
+        """
+        Handle an INIT ACK chunk (client only).
+        """
+        if self._association_state != self.State.COOKIE_WAIT:
+            return
+
+        # cancel T1 timer and process chunk
+        self._t1_cancel()
+        self._last_received_tsn = tsn_minus_one(chunk.initial_tsn)
+        self._reconfig_response_seq = tsn_minus_one(chunk.initial_tsn)
+        self._remote_verification_tag = chunk.initiate_tag
+        self._ssthresh = chunk.advertised_rwnd
+        self._get_extensions(chunk.params)
+
+        self.__log_debug(
+            "- Peer supports %d outbound streams, %d max inbound streams",
+            chunk.outbound_streams,
+            chunk.inbound_streams,
+        )
+        self._inbound_streams_count = min(
+            chunk.outbound_streams, self._inbound_streams_max
+        )
+        self._outbound_streams_count = min(
+            self._outbound_streams_count, chunk.inbound_streams
+        )
+
+        echo = CookieEchoChunk()
+        for k, v in chunk.params:
+            if k == SCTP_STATE_COOKIE:
+                echo.body = v
+                break
+        await self._send_chunk(echo)
+
+        # start T1 timer and enter COOKIE-ECHOED state
+        self._t1_start(echo)
+        self._set_state(self.State.COOKIE_ECHOED)
+
+    @no_type_check
+    async def _receive_reconfig_chunk(self, chunk: ReconfigChunk) -> None:
+        """
+        Handle a RE-CONFIG chunk.
+        """
+        if self._association_state != self.State.ESTABLISHED:
+            return
+
+        for param in chunk.params:
+            cls = RECONFIG_PARAM_TYPES.get(param[0])
+            if cls:
+                await self._receive_reconfig_param(cls.parse(param[1]))
+
     @no_type_check
     async def _receive_sack_chunk(self, chunk: SackChunk) -> None:
         """
@@ -1225,6 +1354,27 @@ class RTCSctpTransport(AsyncIOEventEmitter):
         await self._data_channel_flush()
         await self._transmit()
 
+    async def _receive_shutdown_chunk(self, chunk: ShutdownChunk) -> None:
+        """
+        Handle a SHUTDOWN chunk.
+        """
+        self._t2_cancel()
+        self._set_state(self.State.SHUTDOWN_RECEIVED)
+        ack = ShutdownAckChunk()
+        await self._send_chunk(ack)
+        self._t2_start(ack)
+        self._set_state(self.State.SHUTDOWN_ACK_SENT)
+
+    async def _receive_shutdown_complete_chunk(
+        self, chunk: ShutdownCompleteChunk
+    ) -> None:
+        """
+        Handle a SHUTDOWN COMPLETE chunk.
+        """
+        if self._association_state == self.State.SHUTDOWN_ACK_SENT:
+            self._t2_cancel()
+            self._set_state(self.State.CLOSED)
+
     async def _receive_reconfig_param(self, param):
         """
         Handle a RE-CONFIG parameter.
@@ -1290,9 +1440,14 @@ class RTCSctpTransport(AsyncIOEventEmitter):
         else:
             stream_seq = 0
 
-        fragments = math.ceil(len(user_data) / USERDATA_MAX_LENGTH)
+        # slice fragments out of a memoryview to avoid copying the payload
+        # once per fragment
+        view = memoryview(user_data)
+        fragments = (
+            len(user_data) + USERDATA_MAX_LENGTH - 1
+        ) // USERDATA_MAX_LENGTH
         pos = 0
-        for fragment in range(0, fragments):
+        for fragment in range(fragments):
             chunk = DataChunk()
             chunk.flags = 0
             if not ordered:
@@ -1305,7 +1460,7 @@ class RTCSctpTransport(AsyncIOEventEmitter):
             chunk.stream_id = stream_id
             chunk.stream_seq = stream_seq
             chunk.protocol = pp_id
-            chunk.user_data = user_data[pos : pos + USERDATA_MAX_LENGTH]
+            chunk.user_data = view[pos : pos + USERDATA_MAX_LENGTH]
 
             # FIXME: dynamically added attributes, mypy can't handle them
             # initialize counters
@@ -1329,19 +1484,53 @@ class RTCSctpTransport(AsyncIOEventEmitter):
         # transmit outbound data
         await self._transmit()
 
+    async def _flush_pending(self) -> None:
+        """
+        Send the chunks accumulated by `_send_chunk` as a single packet.
+        """
+        if not self._pending_chunks:
+            return
+
+        data = bytearray(12)
+        SCTP_HEADER.pack_into(
+            data, 0, self._local_port, self._remote_port, self._remote_verification_tag
+        )
+        for chunk_data in self._pending_chunks:
+            data += chunk_data
+        if not self._remote_zero_checksum:
+            SCTP_CHECKSUM.pack_into(data, 8, crc32c(bytes(data)))
+
+        self._pending_chunks = []
+        self._pending_length = 0
+        await self.__transport._send_data(bytes(data))
+
     async def _send_chunk(self, chunk: Chunk) -> None:
         """
-        Transmit a chunk (no bundling for now).
+        Transmit a chunk, bundling it with other outbound chunks whenever
+        `_transmit` is sending several of them.
         """
         self.__log_debug("> %s", chunk)
-        await self.__transport._send_data(
-            serialize_packet(
-                self._local_port,
-                self._remote_port,
-                self._remote_verification_tag,
-                chunk,
+        if self._bundling:
+            chunk_data = bytes(chunk)
+            if (
+                self._pending_chunks
+                and self._pending_length + len(chunk_data) > BUNDLE_MAX_LENGTH
+            ):
+                await self._flush_pending()
+            self._pending_chunks.append(chunk_data)
+            self._pending_length += len(chunk_data)
+        else:
+            await self.__transport._send_data(
+                serialize_packet(
+                    self._local_port,
+                    self._remote_port,
+                    self._remote_verification_tag,
+                    chunk,
+                    # an INIT packet must always carry a correct checksum
+                    zero_checksum=self._remote_zero_checksum
+                    and not isinstance(chunk, InitChunk),
+                )
             )
-        )
 
     async def _send_reconfig_param(self, param):
         chunk = ReconfigChunk()
@@ -1500,11 +1689,19 @@ class RTCSctpTransport(AsyncIOEventEmitter):
             self._t3_handle.cancel()
             self._t3_handle = None
 
-    @no_type_check
     async def _transmit(self) -> None:
         """
         Transmit outbound data.
         """
+        self._bundling += 1
+        try:
+            await self.__transmit()
+        finally:
+            self._bundling -= 1
+            await self._flush_pending()
+
+    @no_type_check
+    async def __transmit(self) -> None:
         # send FORWARD TSN
         if self._forward_tsn_chunk is not None:
             await self._send_chunk(self._forward_tsn_chunk)
@@ -306,7 +306,7 @@ def pack_header_extensions(extensions: List[Tuple[int, bytes]]) -> Tuple[int, by
             extension_value += pack("!BB", x_id, x_length)
             extension_value += x_value
 
-    extension_value += b"\x00" * padl(len(extension_value))
+    extension_value += bytes(padl(len(extension_value)))
     return extension_profile, extension_value
 
 
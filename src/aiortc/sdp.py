@@ -2,6 +2,7 @@ import enum
 import ipaddress
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 from . import rtp
@@ -16,7 +17,18 @@ from .rtcrtpparameters import (
 )
 from .rtcsctptransport import RTCSctpCapabilities
 
+# the ordering is significant, as direction intersections are computed
+# from list indices
 DIRECTIONS = ["inactive", "sendonly", "recvonly", "sendrecv"]
+DIRECTIONS_SET = frozenset(DIRECTIONS)
+
+# precompiled patterns for session description parsing
+CANDIDATE_RE = re.compile(
+    "^([^ ]+) ([0-9]+) ([^ ]+) ([0-9]+) ([^ ]+) ([0-9]+) typ ([^ ]+)(?: (.+))?$"
+)
+IN_ADDR_RE = re.compile("^IN (IP4|IP6) ([^ ]+)$")
+H264_PROFILE_LEVEL_ID_RE = re.compile("[0-9a-f]{6}", re.I)
+M_LINE_RE = re.compile("^m=([^ ]+) ([0-9]+) ([A-Z/]+) (.+)$")
 
 DTLS_ROLE_SETUP = {"auto": "actpass", "client": "active", "server": "passive"}
 DTLS_SETUP_ROLE = dict([(v, k) for (k, v) in DTLS_ROLE_SETUP.items()])
@@ -96,43 +108,47 @@ H264_PROFILE_PATTERNS = [
 
 
 def candidate_from_sdp(sdp: str) -> RTCIceCandidate:
-    bits = sdp.split()
-    assert len(bits) >= 8
+    m = CANDIDATE_RE.match(sdp)
+    assert m
 
     candidate = RTCIceCandidate(
-        component=int(bits[1]),
-        foundation=bits[0],
-        ip=bits[4],
-        port=int(bits[5]),
-        priority=int(bits[3]),
-        protocol=bits[2],
-        type=bits[7],
+        component=int(m.group(2)),
+        foundation=m.group(1),
+        ip=m.group(5),
+        port=int(m.group(6)),
+        priority=int(m.group(4)),
+        protocol=m.group(3),
+        type=m.group(7),
     )
 
-    for i in range(8, len(bits) - 1, 2):
-        if bits[i] == "raddr":
-            candidate.relatedAddress = bits[i + 1]
-        elif bits[i] == "rport":
-            candidate.relatedPort = int(bits[i + 1])
-        elif bits[i] == "tcptype":
-            candidate.tcpType = bits[i + 1]
+    # extension attributes are rare, only tokenize them when present
+    tail = m.group(8)
+    if tail:
+        bits = tail.split()
+        for i in range(0, len(bits) - 1, 2):
+            if bits[i] == "raddr":
+                candidate.relatedAddress = bits[i + 1]
+            elif bits[i] == "rport":
+                candidate.relatedPort = int(bits[i + 1])
+            elif bits[i] == "tcptype":
+                candidate.tcpType = bits[i + 1]
 
     return candidate
 
 
 def candidate_to_sdp(candidate: RTCIceCandidate) -> str:
-    sdp = (
+    parts = [
         f"{candidate.foundation} {candidate.component} {candidate.protocol} "
         f"{candidate.priority} {candidate.ip} {candidate.port} typ {candidate.type}"
-    )
+    ]
 
     if candidate.relatedAddress is not None:
-        sdp += f" raddr {candidate.relatedAddress}"
+        parts.append(f"raddr {candidate.relatedAddress}")
     if candidate.relatedPort is not None:
-        sdp += f" rport {candidate.relatedPort}"
+        parts.append(f"rport {candidate.relatedPort}")
     if candidate.tcpType is not None:
-        sdp += f" tcptype {candidate.tcpType}"
-    return sdp
+        parts.append(f"tcptype {candidate.tcpType}")
+    return " ".join(parts)
 
 
 def grouplines(sdp: str) -> Tuple[List[str], List[List[str]]]:
@@ -149,12 +165,17 @@ def grouplines(sdp: str) -> Tuple[List[str], List[List[str]]]:
 
 
 def ipaddress_from_sdp(sdp: str) -> str:
-    m = re.match("^IN (IP4|IP6) ([^ ]+)$", sdp)
+    m = IN_ADDR_RE.match(sdp)
     assert m
     return m.group(2)
 
 
+@lru_cache()
 def ipaddress_to_sdp(addr: str) -> str:
+    """
+    Format a connection address, caching the result as a session
+    typically repeats the same few addresses across its media sections.
+    """
     version = ipaddress.ip_address(addr).version
     return f"IN IP{version} {addr}"
 
@@ -184,16 +205,13 @@ def parameters_to_sdp(parameters: ParametersDict) -> str:
 
 
 def parse_attr(line: str) -> Tuple[str, Optional[str]]:
-    if ":" in line:
-        bits = line[2:].split(":", 1)
-        return bits[0], bits[1]
-    else:
-        return line[2:], None
+    attr, sep, value = line[2:].partition(":")
+    return attr, (value if sep else None)
 
 
 def parse_h264_profile_level_id(profile_str: str) -> Tuple[H264Profile, H264Level]:
-    if not isinstance(profile_str, str) or not re.match(
-        "[0-9a-f]{6}", profile_str, re.I
+    if not isinstance(profile_str, str) or not H264_PROFILE_LEVEL_ID_RE.match(
+        profile_str
     ):
         raise ValueError("Expected a 6 character hexadecimal string")
 
@@ -357,6 +375,136 @@ class MediaDescription:
         return "\r\n".join(lines) + "\r\n"
 
 
+def _parse_media_candidate(media: "MediaDescription", value: str) -> None:
+    media.ice_candidates.append(candidate_from_sdp(value))
+
+
+def _parse_media_end_of_candidates(media: "MediaDescription", value: str) -> None:
+    media.ice_candidates_complete = True
+
+
+def _parse_media_extmap(media: "MediaDescription", value: str) -> None:
+    ext_id, ext_uri = value.split()
+    if "/" in ext_id:
+        ext_id, ext_direction = ext_id.split("/")
+    extension = RTCRtpHeaderExtensionParameters(id=int(ext_id), uri=ext_uri)
+    media.rtp.headerExtensions.append(extension)
+
+
+def _parse_media_fingerprint(media: "MediaDescription", value: str) -> None:
+    algorithm, fingerprint = value.split()
+    media.dtls.fingerprints.append(
+        RTCDtlsFingerprint(algorithm=algorithm, value=fingerprint)
+    )
+
+
+def _parse_media_ice_options(media: "MediaDescription", value: str) -> None:
+    media.ice_options = value
+
+
+def _parse_media_ice_pwd(media: "MediaDescription", value: str) -> None:
+    media.ice.password = value
+
+
+def _parse_media_ice_ufrag(media: "MediaDescription", value: str) -> None:
+    media.ice.usernameFragment = value
+
+
+def _parse_media_max_message_size(media: "MediaDescription", value: str) -> None:
+    media.sctpCapabilities = RTCSctpCapabilities(maxMessageSize=int(value))
+
+
+def _parse_media_mid(media: "MediaDescription", value: str) -> None:
+    media.rtp.muxId = value
+
+
+def _parse_media_msid(media: "MediaDescription", value: str) -> None:
+    media.msid = value
+
+
+def _parse_media_rtcp(media: "MediaDescription", value: str) -> None:
+    port, _, rest = value.partition(" ")
+    media.rtcp_port = int(port)
+    media.rtcp_host = ipaddress_from_sdp(rest)
+
+
+def _parse_media_rtcp_mux(media: "MediaDescription", value: str) -> None:
+    media.rtcp_mux = True
+
+
+def _parse_media_rtpmap(media: "MediaDescription", value: str) -> None:
+    format_id, _, format_desc = value.partition(" ")
+    bits = format_desc.split("/")
+    if media.kind == "audio":
+        if len(bits) > 2:
+            channels = int(bits[2])
+        else:
+            channels = 1
+    else:
+        channels = None
+    codec = RTCRtpCodecParameters(
+        mimeType=media.kind + "/" + bits[0],
+        channels=channels,
+        clockRate=int(bits[1]),
+        payloadType=int(format_id),
+    )
+    media.rtp.codecs.append(codec)
+
+
+def _parse_media_sctpmap(media: "MediaDescription", value: str) -> None:
+    format_id, _, format_desc = value.partition(" ")
+    media.sctpmap[int(format_id)] = format_desc
+
+
+def _parse_media_sctp_port(media: "MediaDescription", value: str) -> None:
+    media.sctp_port = int(value)
+
+
+def _parse_media_setup(media: "MediaDescription", value: str) -> None:
+    media.dtls.role = DTLS_SETUP_ROLE[value]
+
+
+def _parse_media_ssrc(media: "MediaDescription", value: str) -> None:
+    ssrc_str, _, ssrc_desc = value.partition(" ")
+    ssrc = int(ssrc_str)
+    ssrc_attr, _, ssrc_value = ssrc_desc.partition(":")
+
+    try:
+        ssrc_info = next((x for x in media.ssrc if x.ssrc == ssrc))
+    except StopIteration:
+        ssrc_info = SsrcDescription(ssrc=ssrc)
+        media.ssrc.append(ssrc_info)
+    if ssrc_attr in SSRC_INFO_ATTRS:
+        setattr(ssrc_info, ssrc_attr, ssrc_value)
+
+
+def _parse_media_ssrc_group(media: "MediaDescription", value: str) -> None:
+    parse_group(media.ssrc_group, value, type=int)
+
+
+# dispatch table for the media-level attributes handled on the first pass
+MEDIA_ATTRIBUTES = {
+    "candidate": _parse_media_candidate,
+    "end-of-candidates": _parse_media_end_of_candidates,
+    "extmap": _parse_media_extmap,
+    "fingerprint": _parse_media_fingerprint,
+    "ice-options": _parse_media_ice_options,
+    "ice-pwd": _parse_media_ice_pwd,
+    "ice-ufrag": _parse_media_ice_ufrag,
+    "max-message-size": _parse_media_max_message_size,
+    "mid": _parse_media_mid,
+    "msid": _parse_media_msid,
+    "rtcp": _parse_media_rtcp,
+    "rtcp-mux": _parse_media_rtcp_mux,
+    "rtpmap": _parse_media_rtpmap,
+    "sctpmap": _parse_media_sctpmap,
+    "sctp-port": _parse_media_sctp_port,
+    "setup": _parse_media_setup,
+    "ssrc": _parse_media_ssrc,
+    "ssrc-group": _parse_media_ssrc_group,
+}
+
+
 class SessionDescription:
     def __init__(self) -> None:
         self.version = 0
@@ -387,17 +535,20 @@ class SessionDescription:
         # parse session
         session = cls()
         for line in session_lines:
-            if line.startswith("v="):
+            # SDP lines always start with a single-character type and "=",
+            # so dispatch on the two-character prefix
+            prefix = line[:2]
+            if prefix == "v=":
                 session.version = int(line.strip()[2:])
-            elif line.startswith("o="):
+            elif prefix == "o=":
                 session.origin = line.strip()[2:]
-            elif line.startswith("s="):
+            elif prefix == "s=":
                 session.name = line.strip()[2:]
-            elif line.startswith("c="):
+            elif prefix == "c=":
                 session.host = ipaddress_from_sdp(line[2:])
-            elif line.startswith("t="):
+            elif prefix == "t=":
                 session.time = line.strip()[2:]
-            elif line.startswith("a="):
+            elif prefix == "a=":
                 attr, value = parse_attr(line)
                 if attr == "fingerprint":
                     algorithm, fingerprint = value.split()
@@ -421,7 +572,7 @@ class SessionDescription:
 
         # parse media
         for media_lines in media_groups:
-            m = re.match("^m=([^ ]+) ([0-9]+) ([A-Z/]+) (.+)$", media_lines[0])
+            m = M_LINE_RE.match(media_lines[0])
             assert m
 
             # check payload types are valid
@@ -449,89 +600,16 @@ class SessionDescription:
             session.media.append(current_media)
 
             for line in media_lines[1:]:
-                if line.startswith("c="):
+                prefix = line[:2]
+                if prefix == "c=":
                     current_media.host = ipaddress_from_sdp(line[2:])
-                elif line.startswith("a="):
+                elif prefix == "a=":
                     attr, value = parse_attr(line)
-                    if attr == "candidate":
-                        current_media.ice_candidates.append(candidate_from_sdp(value))
-                    elif attr == "end-of-candidates":
-                        current_media.ice_candidates_complete = True
-                    elif attr == "extmap":
-                        ext_id, ext_uri = value.split()
-                        if "/" in ext_id:
-                            ext_id, ext_direction = ext_id.split("/")
-                        extension = RTCRtpHeaderExtensionParameters(
-                            id=int(ext_id), uri=ext_uri
-                        )
-                        current_media.rtp.headerExtensions.append(extension)
-                    elif attr == "fingerprint":
-                        algorithm, fingerprint = value.split()
-                        current_media.dtls.fingerprints.append(
-                            RTCDtlsFingerprint(algorithm=algorithm, value=fingerprint)
-                        )
-                    elif attr == "ice-options":
-                        current_media.ice_options = value
-                    elif attr == "ice-pwd":
-                        current_media.ice.password = value
-                    elif attr == "ice-ufrag":
-                        current_media.ice.usernameFragment = value
-                    elif attr == "max-message-size":
-                        current_media.sctpCapabilities = RTCSctpCapabilities(
-                            maxMessageSize=int(value)
-                        )
-                    elif attr == "mid":
-                        current_media.rtp.muxId = value
-                    elif attr == "msid":
-                        current_media.msid = value
-                    elif attr == "rtcp":
-                        port, rest = value.split(" ", 1)
-                        current_media.rtcp_port = int(port)
-                        current_media.rtcp_host = ipaddress_from_sdp(rest)
-                    elif attr == "rtcp-mux":
-                        current_media.rtcp_mux = True
-                    elif attr == "setup":
-                        current_media.dtls.role = DTLS_SETUP_ROLE[value]
-                    elif attr in DIRECTIONS:
+                    handler = MEDIA_ATTRIBUTES.get(attr)
+                    if handler is not None:
+                        handler(current_media, value)
+                    elif attr in DIRECTIONS_SET:
                         current_media.direction = attr
-                    elif attr == "rtpmap":
-                        format_id, format_desc = value.split(" ", 1)
-                        bits = format_desc.split("/")
-                        if current_media.kind == "audio":
-                            if len(bits) > 2:
-                                channels = int(bits[2])
-                            else:
-                                channels = 1
-                        else:
-                            channels = None
-                        codec = RTCRtpCodecParameters(
-                            mimeType=current_media.kind + "/" + bits[0],
-                            channels=channels,
-                            clockRate=int(bits[1]),
-                            payloadType=int(format_id),
-                        )
-                        current_media.rtp.codecs.append(codec)
-                    elif attr == "sctpmap":
-                        format_id, format_desc = value.split(" ", 1)
-                        getattr(current_media, attr)[int(format_id)] = format_desc
-                    elif attr == "sctp-port":
-                        current_media.sctp_port = int(value)
-                    elif attr == "ssrc-group":
-                        parse_group(current_media.ssrc_group, value, type=int)
-                    elif attr == "ssrc":
-                        ssrc_str, ssrc_desc = value.split(" ", 1)
-                        ssrc = int(ssrc_str)
-                        ssrc_attr, ssrc_value = ssrc_desc.split(":", 1)
-
-                        try:
-                            ssrc_info = next(
-                                (x for x in current_media.ssrc if x.ssrc == ssrc)
-                            )
-                        except StopIteration:
-                            ssrc_info = SsrcDescription(ssrc=ssrc)
-                            current_media.ssrc.append(ssrc_info)
-                        if ssrc_attr in SSRC_INFO_ATTRS:
-                            setattr(ssrc_info, ssrc_attr, ssrc_value)
 
             if current_media.dtls.role is None:
                 current_media.dtls = None
@@ -21,15 +21,14 @@ def uint16_gt(a: int, b: int) -> bool:
     """
     Return a > b.
     """
-    half_mod = 0x8000
-    return ((a < b) and ((b - a) > half_mod)) or ((a > b) and ((a - b) < half_mod))
+    return 0 < ((a - b) & 0xFFFF) < 0x8000
 
 
 def uint16_gte(a: int, b: int) -> bool:
     """
     Return a >= b.
     """
-    return (a == b) or uint16_gt(a, b)
+    return ((a - b) & 0xFFFF) < 0x8000
 
 
 def uint32_add(a: int, b: int) -> int:
@@ -43,12 +42,11 @@ def uint32_gt(a: int, b: int) -> bool:
     """
     Return a > b.
     """
-    half_mod = 0x80000000
-    return ((a < b) and ((b - a) > half_mod)) or ((a > b) and ((a - b) < half_mod))
+    return 0 < ((a - b) & 0xFFFFFFFF) < 0x80000000
 
 
 def uint32_gte(a: int, b: int) -> bool:
     """
     Return a >= b.
     """
-    return (a == b) or uint32_gt(a, b)
+    return ((a - b) & 0xFFFFFFFF) < 0x80000000
@@ -1 +1,2 @@
+def extend(crc: int, data: bytes) -> int: ...
 def value(data: bytes) -> int: ...
@@ -1,5 +1,6 @@
 import asyncio
 import contextlib
+from struct import pack
 from unittest import TestCase
 from unittest.mock import patch
 
@@ -9,6 +10,7 @@ from aiortc.rtcsctptransport import (
     SCTP_DATA_FIRST_FRAG,
     SCTP_DATA_LAST_FRAG,
     SCTP_DATA_UNORDERED,
+    SCTP_ZERO_CHECKSUM,
     USERDATA_MAX_LENGTH,
     AbortChunk,
     CookieEchoChunk,
@@ -89,10 +91,10 @@ def track_channels(transport):
 
 async def wait_for_outcome(client, server):
     final = [RTCSctpTransport.State.ESTABLISHED, RTCSctpTransport.State.CLOSED]
-    for i in range(100):
+    for i in range(2000):
         if client._association_state in final and server._association_state in final:
             break
-        await asyncio.sleep(0.1)
+        await asyncio.sleep(0.005)
 
 
 class SctpPacketTest(TestCase):
@@ -124,12 +126,46 @@ class SctpPacketTest(TestCase):
             self.roundtrip_packet(data)
         self.assertEqual(str(cm.exception), "SCTP packet has invalid checksum")
 
+    def test_parse_init_zero_checksum(self):
+        # packets carrying an INIT chunk must always have a correct
+        # checksum, even if the zero checksum extension was offered
+        data = load("sctp_init.bin")
+        data = data[0:8] + b"\x00\x00\x00\x00" + data[12:]
+        with self.assertRaises(ValueError) as cm:
+            parse_packet(data, zero_checksum=True)
+        self.assertEqual(str(cm.exception), "SCTP packet has invalid checksum")
+
     def test_parse_init_truncated_packet_header(self):
         data = load("sctp_init.bin")[0:10]
         with self.assertRaises(ValueError) as cm:
             self.roundtrip_packet(data)
         self.assertEqual(str(cm.exception), "SCTP packet length is less than 12 bytes")
 
+    def test_parse_cookie_echo_zero_checksum(self):
+        data = load("sctp_cookie_echo.bin")
+        data = data[0:8] + b"\x00\x00\x00\x00" + data[12:]
+
+        # a zero checksum is only accepted if the extension was offered
+        with self.assertRaises(ValueError) as cm:
+            parse_packet(data)
+        self.assertEqual(str(cm.exception), "SCTP packet has invalid checksum")
+
+        _, _, _, chunks = parse_packet(data, zero_checksum=True)
+        self.assertEqual(len(chunks), 1)
+        self.assertIsInstance(chunks[0], CookieEchoChunk)
+
+    def test_serialize_zero_checksum(self):
+        data = load("sctp_cookie_echo.bin")
+        source_port, destination_port, verification_tag, chunks = parse_packet(data)
+        output = serialize_packet(
+            source_port,
+            destination_port,
+            verification_tag,
+            chunks[0],
+            zero_checksum=True,
+        )
+        self.assertEqual(output, data[0:8] + b"\x00\x00\x00\x00" + data[12:])
+
     def test_parse_cookie_echo(self):
         data = load("sctp_cookie_echo.bin")
         chunk = self.roundtrip_packet(data)
@@ -734,6 +770,63 @@ class RTCSctpTransportTest(TestCase):
                 received = await server_queue.get()
                 self.assertEqual(received, message)
 
+    @asynctest
+    async def test_connect_zero_checksum(self):
+        async with client_and_server() as (client, server):
+            # connect
+            await server.start(client.getCapabilities(), client.port)
+            await client.start(server.getCapabilities(), server.port)
+
+            # check outcome: both parties advertised the extension, so
+            # both send zero checksums
+            await wait_for_outcome(client, server)
+            self.assertTrue(client._remote_zero_checksum)
+            self.assertTrue(server._remote_zero_checksum)
+
+    @asynctest
+    async def test_connect_without_zero_checksum(self):
+        async with client_and_server() as (client, server):
+            server._local_zero_checksum = False
+
+            # connect
+            await server.start(client.getCapabilities(), client.port)
+            await client.start(server.getCapabilities(), server.port)
+
+            # check outcome: the server did not advertise the extension,
+            # so the client keeps sending real checksums
+            await wait_for_outcome(client, server)
+            self.assertEqual(
+                client._association_state, RTCSctpTransport.State.ESTABLISHED
+            )
+            self.assertFalse(client._remote_zero_checksum)
+            self.assertEqual(
+                server._association_state, RTCSctpTransport.State.ESTABLISHED
+            )
+            self.assertTrue(server._remote_zero_checksum)
+
+            # transmit data over the checksummed path
+            server_queue = asyncio.Queue()
+
+            async def server_fake_receive(*args):
+                await server_queue.put(args)
+
+            server._receive = server_fake_receive
+
+            message = (123, 0, b"ping")
+            await client._send(*message)
+            received = await server_queue.get()
+            self.assertEqual(received, message)
+
+    @asynctest
+    async def test_zero_checksum_incompatible_method(self):
+        async with client_standalone() as client:
+            # only EDMID 1 (lower layer DTLS) is recognized
+            client._get_extensions([(SCTP_ZERO_CHECKSUM, pack("!L", 2))])
+            self.assertFalse(client._remote_zero_checksum)
+
+            client._get_extensions([(SCTP_ZERO_CHECKSUM, pack("!L", 1))])
+            self.assertTrue(client._remote_zero_checksum)
+
     @asynctest
     async def test_connect_client_limits_streams(self):
         async with client_and_server() as (client, server):
@@ -1296,7 +1389,6 @@ class RTCSctpTransportTest(TestCase):
             await server._handle_data(b"garbage")
 
             # check outcome
-            await asyncio.sleep(0.1)
             self.assertEqual(server._association_state, RTCSctpTransport.State.CLOSED)
 
     @asynctest
@@ -1309,18 +1401,19 @@ class RTCSctpTransportTest(TestCase):
             await server._handle_data(data)
 
             # check outcome
-            await asyncio.sleep(0.1)
             self.assertEqual(server._association_state, RTCSctpTransport.State.CLOSED)
 
     @asynctest
     async def test_bad_cookie(self):
         async with client_and_server() as (client, server):
-            # corrupt cookie
+            # corrupt the cookie, then get out of the way: retransmissions
+            # re-send the same corrupted chunk object
             real_send_chunk = client._send_chunk
 
             async def mock_send_chunk(chunk):
                 if isinstance(chunk, CookieEchoChunk):
                     chunk.body = b"garbage"
+                    client._send_chunk = real_send_chunk
                 return await real_send_chunk(chunk)
 
             client._send_chunk = mock_send_chunk
@@ -1422,7 +1515,7 @@ class RTCSctpTransportTest(TestCase):
             await client.start(server.getCapabilities(), server.port)
 
             # check outcome
-            await asyncio.sleep(0.1)
+            await wait_for_outcome(client, server)
             self.assertEqual(client._association_state, RTCSctpTransport.State.CLOSED)
             self.assertEqual(server._association_state, RTCSctpTransport.State.CLOSED)
 
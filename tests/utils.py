@@ -107,6 +107,7 @@ async def dummy_dtls_transport_pair():
         await dtls_b.stop()
 
 
+@functools.lru_cache()
 def load(name: str) -> bytes:
     path = os.path.join(os.path.dirname(__file__), name)
     with open(path, "rb") as fp: